@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable
+
+from pyfunq.owner import Owner
+from pyfunq.reuse_scope import ReuseScope
+
+
+class BlueprintEntry:
+    def __init__(
+        self,
+        service_type: str,
+        factory_type: tuple[str, ...],
+        factory: str | None,
+        owner: Owner,
+        reuse_scope: ReuseScope,
+        name: str | None = None,
+    ):
+        self._name = name
+        self._owner = owner
+        self._factory = factory
+        self._reuse_scope = reuse_scope
+        self._service_type = service_type
+        self._factory_type = factory_type
+
+    @property
+    def service_type(self) -> str:
+        return self._service_type
+
+    @property
+    def factory_type(self) -> tuple[str, ...]:
+        return self._factory_type
+
+    @property
+    def factory(self) -> str | None:
+        return self._factory
+
+    @property
+    def owner(self) -> Owner:
+        return self._owner
+
+    @property
+    def reuse_scope(self) -> ReuseScope:
+        return self._reuse_scope
+
+    @property
+    def name(self) -> str | None:
+        return self._name
+
+
+class ContainerBlueprint:
+    def __init__(self, entries: list[BlueprintEntry], default_owner: Owner, default_reuse: ReuseScope):
+        self._entries = entries
+        self._default_owner = default_owner
+        self._default_reuse = default_reuse
+
+    @property
+    def entries(self) -> list[BlueprintEntry]:
+        return self._entries
+
+    @property
+    def default_owner(self) -> Owner:
+        return self._default_owner
+
+    @property
+    def default_reuse(self) -> ReuseScope:
+        return self._default_reuse
+
+
+def import_path_of(target: type | Callable) -> str:
+    module = getattr(target, '__module__', None)
+    qualname = getattr(target, '__qualname__', None)
+    if module is None or qualname is None or '<' in qualname:
+        raise ValueError(f'{target!r} can not be referenced by an import path')
+    path = f'{module}:{qualname}'
+    if import_from_path(path) is not target:
+        raise ValueError(f'{target!r} is not reachable through {path}')
+    return path
+
+
+def import_from_path(path: str) -> Any:
+    module_name, qualname = path.split(':')
+    target: Any = importlib.import_module(module_name)
+    for attribute in qualname.split('.'):
+        target = getattr(target, attribute)
+    return target
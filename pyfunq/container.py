@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import sys
+import threading
 import weakref
 from contextlib import AbstractContextManager
+from functools import partial
 from types import TracebackType
 from typing import Any, Callable, Optional, Type, TypeVar
 
 from _weakref import ReferenceType
 
+from pyfunq.blueprint import BlueprintEntry, ContainerBlueprint, import_from_path, import_path_of
+from pyfunq.container_stats import CachedInstanceStats, ContainerStats, RetainedSizeWalk
 from pyfunq.owner import Owner
 from pyfunq.registration import Registration
 from pyfunq.resolution_error import ResolutionError
@@ -26,6 +31,8 @@ class Container(AbstractContextManager):
         self._parent_container: Container | None = None
         self._disposables: list[ReferenceType[Any]] = []
         self._services: dict[ServiceKey, ServiceEntry] = dict()
+        self._child_containers: weakref.WeakSet[Container] = weakref.WeakSet()
+        self._lock = threading.Lock()
 
     def register(self, service_type: Type | list[type], factory: Optional[Callable] = None) -> Registration:
         ctor, *params = service_type if isinstance(service_type, list) else [service_type]
@@ -39,9 +46,43 @@ class Container(AbstractContextManager):
             factory_type=tuple(params),
             reuse_scope=self.default_reuse
         )
-        self._registrations.append(registration)
+        with self._lock:
+            self._registrations.append(registration)
         return registration
 
+    def replace(self, service_type: Type | list[type], factory: Callable, name: str | None = None) -> None:
+        ctor, *params = service_type if isinstance(service_type, list) else [service_type]
+        service_key = ServiceKey(ctor, tuple(params), name)
+        with self._lock:
+            pending_registrations = [
+                registration for registration in self._registrations
+                if self._registration_service_key(registration) == service_key
+            ]
+            services = dict(self._services)
+            replaced_entry = services.get(service_key)
+            if len(pending_registrations) > 0:
+                owner = pending_registrations[0]._owner
+                reuse_scope = pending_registrations[0]._reuse_scope
+            elif replaced_entry is not None:
+                owner = replaced_entry._owner
+                reuse_scope = replaced_entry._reuse_scope
+            else:
+                owner = self.default_owner
+                reuse_scope = self.default_reuse
+            services[service_key] = ServiceEntry(
+                container=self,
+                owner=owner,
+                factory=factory,
+                reuse_scope=reuse_scope,
+            )
+            self._services = services
+            self._registrations[:] = [
+                registration for registration in self._registrations
+                if registration not in pending_registrations
+            ]
+        if replaced_entry is not None:
+            self._invalidate_clones(service_key, replaced_entry)
+
     def configure(self) -> None:
         self._configure()
         parent_container = self._parent_container
@@ -49,23 +90,79 @@ class Container(AbstractContextManager):
             parent_container.configure()
 
     def _configure(self):
-        while len(self._registrations) > 0:
-            registration = self._registrations.pop()
-            service_key = ServiceKey(
-                name=registration._name,
-                service_type=registration._service_type,
-                factory_type=registration._factory_type,
-            )
-            self._services[service_key] = ServiceEntry(
-                container=self,
-                owner=registration._owner,
-                factory=registration._factory,
-                reuse_scope=registration._reuse_scope,
-            )
+        if len(self._registrations) == 0:
+            return
+        with self._lock:
+            services = dict(self._services)
+            while len(self._registrations) > 0:
+                registration = self._registrations.pop()
+                service_key = self._registration_service_key(registration)
+                services[service_key] = ServiceEntry(
+                    container=self,
+                    owner=registration._owner,
+                    factory=registration._factory,
+                    reuse_scope=registration._reuse_scope,
+                )
+            self._services = services
+
+    def export_blueprint(self) -> ContainerBlueprint:
+        entries = self._blueprint_entries()
+        return ContainerBlueprint(
+            list(entries.values()),
+            default_owner=self.default_owner,
+            default_reuse=self.default_reuse,
+        )
+
+    def _blueprint_entries(self) -> dict[ServiceKey, BlueprintEntry]:
+        parent_container = self._parent_container
+        entries = parent_container._blueprint_entries() if parent_container is not None else dict()
+        for service_key, service_entry in self._services.items():
+            if service_entry._source is None:
+                entries[service_key] = self._blueprint_entry(service_key, service_entry)
+        for registration in reversed(list(self._registrations)):
+            service_key = self._registration_service_key(registration)
+            entries[service_key] = self._blueprint_entry(service_key, registration)
+        return entries
+
+    def _blueprint_entry(self, service_key: ServiceKey, registration: ServiceEntry | Registration) -> BlueprintEntry:
+        return BlueprintEntry(
+            service_type=import_path_of(service_key.service_type),
+            factory_type=tuple(import_path_of(factory_type) for factory_type in service_key.factory_type),
+            factory=self._factory_import_path(registration._factory),
+            owner=registration._owner,
+            reuse_scope=registration._reuse_scope,
+            name=service_key.name,
+        )
+
+    @staticmethod
+    def from_blueprint(blueprint: ContainerBlueprint) -> Container:
+        container = Container()
+        container.default_owner = blueprint.default_owner
+        container.default_reuse = blueprint.default_reuse
+        imported: dict[str, Any] = dict()
+        for entry in blueprint.entries:
+            service_type = Container._import_cached(entry.service_type, imported)
+            factory_type = [Container._import_cached(path, imported) for path in entry.factory_type]
+            factory = Container._import_cached(entry.factory, imported) if entry.factory is not None else None
+            registration = container.register([service_type, *factory_type], factory)
+            if entry.name is not None:
+                registration.named(entry.name)
+            registration.reused_within(entry.reuse_scope).owned_by(entry.owner)
+        container.configure()
+        return container
+
+    @staticmethod
+    def _registration_service_key(registration: Registration) -> ServiceKey:
+        return ServiceKey(
+            name=registration._name,
+            service_type=registration._service_type,
+            factory_type=registration._factory_type,
+        )
 
     def create_child_container(self) -> Container:
         container = Container()
         container._parent_container = self
+        self._child_containers.add(container)
         return container
 
     def resolve(self, ctor: Type[TService], *args) -> TService:
@@ -80,6 +177,65 @@ class Container(AbstractContextManager):
     def try_resolve_named(self, ctor: Type[TService], name: str, *args) -> TService:
         return self._try_resolve_internal(ctor, *args, name=name)
 
+    def collect_stats(self, max_objects_per_instance: int = 10_000, max_objects: int = 100_000) -> ContainerStats:
+        walk = RetainedSizeWalk(
+            boundary_types=(Container, ServiceEntry, Registration),
+            boundary_instances=[
+                service_entry._instance
+                for container in self._hierarchy_containers()
+                for service_entry in container._services.values()
+                if service_entry._instance is not None
+            ],
+            max_objects_per_instance=max_objects_per_instance,
+            max_objects=max_objects,
+        )
+        return self._collect_stats(walk)
+
+    def _hierarchy_containers(self) -> list[Container]:
+        containers = [self]
+        for child_container in list(self._child_containers):
+            containers.extend(child_container._hierarchy_containers())
+        return containers
+
+    def _collect_stats(self, walk: RetainedSizeWalk) -> ContainerStats:
+        services = self._services
+        registrations = list(self._registrations)
+        disposables = list(self._disposables)
+        live_disposables_count = sum(1 for weak_ref in disposables if weak_ref() is not None)
+        cached_instances = []
+        for service_key, service_entry in services.items():
+            if service_entry._instance is None:
+                continue
+            retained_size, is_truncated = walk.retained_size_of(service_entry._instance)
+            cached_instances.append(CachedInstanceStats(
+                service_key=service_key,
+                reuse_scope=service_entry._reuse_scope,
+                instance_type=type(service_entry._instance),
+                retained_size=retained_size,
+                is_truncated=is_truncated,
+            ))
+        bookkeeping_size = (
+            sys.getsizeof(services) +
+            sum(sys.getsizeof(service_key) for service_key in services.keys()) +
+            sum(sys.getsizeof(service_entry) for service_entry in services.values()) +
+            sys.getsizeof(registrations) +
+            sum(sys.getsizeof(registration) for registration in registrations) +
+            sys.getsizeof(disposables) +
+            sum(sys.getsizeof(weak_ref) for weak_ref in disposables)
+        )
+        return ContainerStats(
+            services_count=len(services),
+            pending_registrations_count=len(registrations),
+            bookkeeping_size=bookkeeping_size,
+            cached_instances=cached_instances,
+            live_disposables_count=live_disposables_count,
+            dead_disposables_count=len(disposables) - live_disposables_count,
+            child_containers=[
+                child_container._collect_stats(walk)
+                for child_container in list(self._child_containers)
+            ],
+        )
+
     def dispose(self) -> None:
         self.__exit__(None, None, None)
 
@@ -98,7 +254,24 @@ class Container(AbstractContextManager):
 
     @staticmethod
     def __closure__(ctor: Type) -> Callable:
-        return lambda _: ctor()
+        return partial(Container._create_instance, ctor)
+
+    @staticmethod
+    def _create_instance(ctor: Type, _: Container) -> Any:
+        return ctor()
+
+    @staticmethod
+    def _factory_import_path(factory: Callable) -> str | None:
+        if isinstance(factory, partial) and factory.func is Container._create_instance:
+            return None
+        return import_path_of(factory)
+
+    @staticmethod
+    def _import_cached(path: str, imported: dict[str, Any]) -> Any:
+        target = imported.get(path)
+        if target is None:
+            target = imported[path] = import_from_path(path)
+        return target
 
     def _resolve_internal(self, ctor: Type[TService], *args, name: str | None = None) -> TService:
         arg_types = (type(arg) for arg in args)
@@ -120,10 +293,34 @@ class Container(AbstractContextManager):
             reuse_scope = service_entry._reuse_scope
             container = service_entry._container
             if reuse_scope == ReuseScope.Container and container is not self:
-                service_entry = self._clone_service_entry(service_entry)
-                self._services[service_key] = service_entry
+                return self._publish_clone(service_key, service_entry)
         return service_entry
 
+    def _publish_clone(self, service_key: ServiceKey, service_entry: ServiceEntry) -> ServiceEntry | None:
+        with self._lock:
+            published_entry = self._services.get(service_key)
+            if published_entry is not None:
+                return published_entry
+            source_container = service_entry._container
+            if source_container._services.get(service_key) is service_entry:
+                cloned_entry = self._clone_service_entry(service_entry)
+                services = dict(self._services)
+                services[service_key] = cloned_entry
+                self._services = services
+                return cloned_entry
+        return self._get_service_entry(service_key)
+
+    def _invalidate_clones(self, service_key: ServiceKey, replaced_entry: ServiceEntry) -> None:
+        for child_container in list(self._child_containers):
+            with child_container._lock:
+                cloned_entry = child_container._services.get(service_key)
+                if cloned_entry is None or cloned_entry._source is not replaced_entry:
+                    continue
+                services = dict(child_container._services)
+                del services[service_key]
+                child_container._services = services
+            child_container._invalidate_clones(service_key, cloned_entry)
+
     def _get_hierarchy_service_entry(self, service_key: ServiceKey) -> ServiceEntry | None:
         service_entry = self._services.get(service_key)
         if service_entry is not None:
@@ -157,4 +354,5 @@ class Container(AbstractContextManager):
             owner=service_entry._owner,
             factory=service_entry._factory,
             reuse_scope=service_entry._reuse_scope,
+            source=service_entry,
         )
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import gc
+import sys
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from typing import Any
+
+from pyfunq.reuse_scope import ReuseScope
+from pyfunq.service_key import ServiceKey
+
+_SHARED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType)
+
+
+class CachedInstanceStats:
+    def __init__(
+        self,
+        service_key: ServiceKey,
+        reuse_scope: ReuseScope,
+        instance_type: type,
+        retained_size: int,
+        is_truncated: bool,
+    ):
+        self._is_truncated = is_truncated
+        self._retained_size = retained_size
+        self._service_key = service_key
+        self._reuse_scope = reuse_scope
+        self._instance_type = instance_type
+
+    @property
+    def service_key(self) -> ServiceKey:
+        return self._service_key
+
+    @property
+    def reuse_scope(self) -> ReuseScope:
+        return self._reuse_scope
+
+    @property
+    def instance_type(self) -> type:
+        return self._instance_type
+
+    @property
+    def retained_size(self) -> int:
+        return self._retained_size
+
+    @property
+    def is_truncated(self) -> bool:
+        return self._is_truncated
+
+
+class ContainerStats:
+    def __init__(
+        self,
+        services_count: int,
+        pending_registrations_count: int,
+        bookkeeping_size: int,
+        cached_instances: list[CachedInstanceStats],
+        live_disposables_count: int,
+        dead_disposables_count: int,
+        child_containers: list[ContainerStats],
+    ):
+        self._services_count = services_count
+        self._bookkeeping_size = bookkeeping_size
+        self._cached_instances = cached_instances
+        self._child_containers = child_containers
+        self._live_disposables_count = live_disposables_count
+        self._dead_disposables_count = dead_disposables_count
+        self._pending_registrations_count = pending_registrations_count
+
+    @property
+    def services_count(self) -> int:
+        return self._services_count
+
+    @property
+    def pending_registrations_count(self) -> int:
+        return self._pending_registrations_count
+
+    @property
+    def cached_instances(self) -> list[CachedInstanceStats]:
+        return self._cached_instances
+
+    @property
+    def live_disposables_count(self) -> int:
+        return self._live_disposables_count
+
+    @property
+    def dead_disposables_count(self) -> int:
+        return self._dead_disposables_count
+
+    @property
+    def child_containers(self) -> list[ContainerStats]:
+        return self._child_containers
+
+    @property
+    def cached_instances_count(self) -> int:
+        return len(self._cached_instances)
+
+    @property
+    def bookkeeping_size(self) -> int:
+        return self._bookkeeping_size
+
+    @property
+    def instances_retained_size(self) -> int:
+        return sum(cached_instance.retained_size for cached_instance in self._cached_instances)
+
+    @property
+    def retained_size(self) -> int:
+        return self._bookkeeping_size + self.instances_retained_size
+
+    @property
+    def total_retained_size(self) -> int:
+        return self.retained_size + sum(child.total_retained_size for child in self._child_containers)
+
+    @property
+    def instances_count_by_reuse_scope(self) -> dict[ReuseScope, int]:
+        counts = {reuse_scope: 0 for reuse_scope in ReuseScope}
+        for cached_instance in self._cached_instances:
+            counts[cached_instance.reuse_scope] += 1
+        return counts
+
+
+class RetainedSizeWalk:
+    def __init__(
+        self,
+        boundary_types: tuple[type, ...],
+        boundary_instances: list[Any],
+        max_objects_per_instance: int,
+        max_objects: int,
+    ):
+        self._visited: set[int] = set()
+        self._remaining_objects = max_objects
+        self._boundary_types = _SHARED_TYPES + boundary_types
+        self._max_objects_per_instance = max_objects_per_instance
+        self._boundary_ids = {id(instance) for instance in boundary_instances}
+
+    def retained_size_of(self, root: Any) -> tuple[int, bool]:
+        size = 0
+        walked_objects = 0
+        is_truncated = False
+        pending = [root]
+        while len(pending) > 0:
+            instance = pending.pop()
+            if id(instance) in self._visited or (instance is not root and self._is_boundary(instance)):
+                continue
+            if walked_objects >= self._max_objects_per_instance or self._remaining_objects <= 0:
+                return size, True
+            self._visited.add(id(instance))
+            walked_objects += 1
+            self._remaining_objects -= 1
+            size += sys.getsizeof(instance)
+            referents = gc.get_referents(instance)
+            capacity = min(self._max_objects_per_instance - walked_objects, self._remaining_objects)
+            if len(referents) > capacity:
+                referents = referents[:capacity]
+                is_truncated = True
+            pending.extend(referents)
+        return size, is_truncated
+
+    def _is_boundary(self, instance: Any) -> bool:
+        return isinstance(instance, self._boundary_types) or id(instance) in self._boundary_ids
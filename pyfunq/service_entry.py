@@ -12,8 +12,10 @@ class ServiceEntry:
         reuse_scope: ReuseScope,
         instance: Any | None = None,
         owner: Owner = Owner.External,
+        source: Any | None = None,
     ):
         self._owner = owner
+        self._source = source
         self._factory = factory
         self._instance = instance
         self._container = container
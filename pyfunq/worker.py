@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from pyfunq.blueprint import ContainerBlueprint
+from pyfunq.container import Container
+
+_worker_container: Container | None = None
+
+
+def initialize_worker_container(blueprint: ContainerBlueprint) -> None:
+    global _worker_container
+    _worker_container = Container.from_blueprint(blueprint)
+
+
+def get_worker_container() -> Container:
+    if _worker_container is None:
+        raise RuntimeError('worker container was not initialized, use initialize_worker_container as initializer')
+    return _worker_container
@@ -0,0 +1,169 @@
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import cast
+
+import pytest
+
+from pyfunq.blueprint import import_from_path, import_path_of
+from pyfunq.container import Container
+from pyfunq.owner import Owner
+from pyfunq.reuse_scope import ReuseScope
+from pyfunq.worker import get_worker_container, initialize_worker_container
+from tests.test_container import Bar, Foo, FooContextManager, IBar, IFoo
+
+
+class TestBlueprint:
+    def test_import_path_round_trip(self):
+        assert import_path_of(Bar) == 'tests.test_container:Bar'
+        assert import_from_path(import_path_of(Bar)) is Bar
+        assert import_from_path(import_path_of(create_foo)) is create_foo
+
+    def test_import_path_of_lambda_raises_value_error(self):
+        with pytest.raises(ValueError):
+            import_path_of(lambda c: Bar())
+
+    def test_export_blueprint_of_lambda_factory_raises_value_error(self):
+        container = Container()
+        container.register(IBar, lambda c: Bar())
+        container.configure()
+
+        with pytest.raises(ValueError):
+            container.export_blueprint()
+
+    def test_blueprint_survives_pickling(self):
+        container = create_configured_container()
+        blueprint = pickle.loads(pickle.dumps(container.export_blueprint()))
+        entries = {(entry.service_type, entry.name): entry for entry in blueprint.entries}
+
+        assert len(blueprint.entries) == 5
+        assert entries[('tests.test_container:IBar', None)].factory == 'tests.test_blueprint:create_bar'
+        assert entries[('tests.test_container:IBar', None)].reuse_scope == ReuseScope.Container
+        assert entries[('tests.test_container:IBar', 'named')].factory == 'tests.test_blueprint:create_named_bar'
+        assert entries[('tests.test_container:IBar', 'with_arg')].factory_type == ('builtins:str',)
+        assert entries[('tests.test_container:IFoo', None)].owner == Owner.Container
+        assert entries[('tests.test_container:Bar', None)].factory is None
+
+    def test_container_rebuilt_from_blueprint_is_equivalent(self):
+        container = Container.from_blueprint(create_configured_container().export_blueprint())
+        foo = cast(Foo, container.resolve(IFoo))
+
+        assert container.resolve(IBar) is container.resolve(IBar)
+        assert cast(Bar, container.resolve_named(IBar, 'named')).arg1 == 'named'
+        assert cast(Bar, container.resolve_named(IBar, 'with_arg', 'foo')).arg1 == 'foo'
+        assert isinstance(container.resolve(Bar), Bar)
+        assert foo.bar is container.resolve(IBar)
+
+    def test_blueprint_includes_pending_registrations_without_configuring(self):
+        container = Container()
+        container.register(IBar, create_bar)
+        container.configure()
+        container.register(IBar, create_named_bar)
+        container.register(IBar, create_bar)
+        container.register(Bar)
+        blueprint = container.export_blueprint()
+        rebuilt_container = Container.from_blueprint(blueprint)
+
+        assert len(blueprint.entries) == 2
+        assert container.collect_stats().pending_registrations_count == 3
+        assert cast(Bar, rebuilt_container.resolve(IBar)).arg1 == 'named'
+        assert isinstance(rebuilt_container.resolve(Bar), Bar)
+
+    def test_blueprint_keeps_container_defaults(self):
+        container = Container()
+        container.default_owner = Owner.Container
+        container.default_reuse = ReuseScope.Hierarchy
+        container.configure()
+        rebuilt_container = Container.from_blueprint(container.export_blueprint())
+
+        assert rebuilt_container.default_owner == Owner.Container
+        assert rebuilt_container.default_reuse == ReuseScope.Hierarchy
+
+    def test_blueprint_of_a_child_container_includes_its_ancestors_entries(self):
+        container = create_configured_container()
+        child_container = container.create_child_container()
+        child_container.register(IBar, create_named_bar).named('child')
+        child_container.configure()
+        child_container.resolve(IBar)
+        blueprint = child_container.export_blueprint()
+        rebuilt_container = Container.from_blueprint(blueprint)
+
+        assert len(blueprint.entries) == 6
+        assert cast(Bar, rebuilt_container.resolve_named(IBar, 'child')).arg1 == 'named'
+        assert isinstance(rebuilt_container.resolve(IFoo), Foo)
+
+    def test_blueprint_of_a_child_container_prefers_its_own_registrations(self):
+        container = create_configured_container()
+        child_container = container.create_child_container()
+        child_container.register(IBar, create_named_bar)
+        child_container.configure()
+        rebuilt_container = Container.from_blueprint(child_container.export_blueprint())
+
+        assert cast(Bar, rebuilt_container.resolve(IBar)).arg1 == 'named'
+
+    def test_blueprint_preserves_ownership_of_disposables(self):
+        container = Container()
+        container.register(IFoo, create_foo_context_manager) \
+                 .reused_within(ReuseScope.Container) \
+                 .owned_by(Owner.Container)
+        container.configure()
+
+        with Container.from_blueprint(container.export_blueprint()) as rebuilt_container:
+            foo = cast(FooContextManager, rebuilt_container.resolve(IFoo))
+
+        assert foo.is_disposed
+
+
+class TestWorker:
+    def test_get_worker_container_before_initialization_raises_runtime_error(self):
+        with pytest.raises(RuntimeError):
+            get_worker_container()
+
+    def test_spawned_workers_resolve_using_the_blueprint(self):
+        blueprint = create_configured_container().export_blueprint()
+        context = multiprocessing.get_context('spawn')
+
+        with ProcessPoolExecutor(
+            max_workers=2,
+            mp_context=context,
+            initializer=initialize_worker_container,
+            initargs=(blueprint,)
+        ) as executor:
+            results = list(executor.map(resolve_in_worker, ['a', 'b', 'c']))
+
+        assert results == ['a', 'b', 'c']
+
+
+def create_bar(_: Container) -> Bar:
+    return Bar()
+
+
+def create_named_bar(_: Container) -> Bar:
+    return Bar('named')
+
+
+def create_bar_with_arg(_: Container, arg1: str) -> Bar:
+    return Bar(arg1)
+
+
+def create_foo(container: Container) -> Foo:
+    return Foo(cast(Bar, container.resolve(IBar)))
+
+
+def create_foo_context_manager(_: Container) -> FooContextManager:
+    return FooContextManager()
+
+
+def create_configured_container() -> Container:
+    container = Container()
+    container.register(IBar, create_bar).reused_within(ReuseScope.Container)
+    container.register(IBar, create_named_bar).named('named')
+    container.register([IBar, str], create_bar_with_arg).named('with_arg')
+    container.register(IFoo, create_foo).owned_by(Owner.Container)
+    container.register(Bar)
+    container.configure()
+    return container
+
+
+def resolve_in_worker(value: str) -> str | None:
+    return cast(Bar, get_worker_container().resolve_named(IBar, 'with_arg', value)).arg1
@@ -305,6 +305,111 @@ class TestContainer:
 
         assert foo.is_disposed
 
+    def test_replace_swaps_the_factory_of_a_configured_service(self):
+        container = Container()
+        container.register(IBar, lambda c: Bar("old")).reused_within(ReuseScope.Container)
+        container.configure()
+        old_bar = cast(Bar, container.resolve(IBar))
+        container.replace(IBar, lambda c: Bar("new"))
+        new_bar = cast(Bar, container.resolve(IBar))
+
+        assert old_bar.arg1 == "old"
+        assert new_bar.arg1 == "new"
+        assert new_bar is container.resolve(IBar)
+
+    def test_replace_named_service_does_not_affect_other_names(self):
+        container = Container()
+        container.register(IBar, lambda c: Bar("a")).named("a")
+        container.register(IBar, lambda c: Bar("b")).named("b")
+        container.configure()
+        container.replace(IBar, lambda c: Bar("c"), name="a")
+
+        assert cast(Bar, container.resolve_named(IBar, "a")).arg1 == "c"
+        assert cast(Bar, container.resolve_named(IBar, "b")).arg1 == "b"
+
+    def test_replace_service_with_arguments(self):
+        container = Container()
+        container.register([IBar, str], lambda c, s: Bar(arg1=s))
+        container.configure()
+        container.replace([IBar, str], lambda c, s: Bar(arg1=s.upper()))
+
+        assert cast(Bar, container.resolve(IBar, "foo")).arg1 == "FOO"
+
+    def test_replace_invalidates_entries_cloned_by_child_containers(self):
+        container = Container()
+        container.register(IBar, lambda c: Bar("old")).reused_within(ReuseScope.Container)
+        container.configure()
+        child_container = container.create_child_container()
+        grand_child_container = child_container.create_child_container()
+        old_child_bar = child_container.resolve(IBar)
+        old_grand_child_bar = grand_child_container.resolve(IBar)
+        container.replace(IBar, lambda c: Bar("new"))
+        child_bar = cast(Bar, child_container.resolve(IBar))
+        grand_child_bar = cast(Bar, grand_child_container.resolve(IBar))
+
+        assert child_bar is not old_child_bar
+        assert grand_child_bar is not old_grand_child_bar
+        assert child_bar.arg1 == "new"
+        assert grand_child_bar.arg1 == "new"
+        assert child_bar is child_container.resolve(IBar)
+
+    def test_replace_invalidates_hierarchy_singleton_resolved_by_child_containers(self):
+        container = Container()
+        container.register(IBar, lambda c: Bar("old")).reused_within(ReuseScope.Hierarchy)
+        container.configure()
+        child_container = container.create_child_container()
+        old_bar = child_container.resolve(IBar)
+        container.replace(IBar, lambda c: Bar("new"))
+        bar = cast(Bar, child_container.resolve(IBar))
+
+        assert bar is not old_bar
+        assert bar.arg1 == "new"
+        assert bar is container.resolve(IBar)
+
+    def test_replace_does_not_invalidate_child_container_own_registrations(self):
+        container = Container()
+        container.register(IBar, lambda c: Bar("parent")).reused_within(ReuseScope.Container)
+        container.configure()
+        child_container = container.create_child_container()
+        child_container.register(IBar, lambda c: Bar("child"))
+        child_container.configure()
+        container.replace(IBar, lambda c: Bar("new"))
+
+        assert cast(Bar, child_container.resolve(IBar)).arg1 == "child"
+
+    def test_replace_drops_pending_registrations_of_the_same_service(self):
+        container = Container()
+        container.register(IBar, lambda c: Bar("old"))
+        container.register(IBar, lambda c: Bar("a")).named("a")
+        container.replace(IBar, lambda c: Bar("new"))
+        container.configure()
+
+        assert cast(Bar, container.resolve(IBar)).arg1 == "new"
+        assert cast(Bar, container.resolve_named(IBar, "a")).arg1 == "a"
+
+    def test_replace_keeps_reuse_scope_and_owner_of_pending_registration(self):
+        foo: FooContextManager
+
+        with Container() as container:
+            container \
+                .register(IFoo, lambda c: Foo(Bar())) \
+                .reused_within(ReuseScope.Container) \
+                .owned_by(Owner.Container)
+            container.replace(IFoo, lambda c: FooContextManager())
+            container.configure()
+            foo = cast(FooContextManager, container.resolve(IFoo))
+
+            assert foo is container.resolve(IFoo)
+
+        assert foo.is_disposed
+
+    def test_replace_registers_service_when_it_was_not_configured(self):
+        container = Container()
+        container.configure()
+        container.replace(IBar, lambda c: Bar())
+
+        assert isinstance(container.resolve(IBar), Bar)
+
 
 class IFoo(ABC):
     pass
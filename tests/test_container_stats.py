@@ -0,0 +1,152 @@
+import gc
+import sys
+from typing import cast
+
+from pyfunq.container import Container
+from pyfunq.owner import Owner
+from pyfunq.reuse_scope import ReuseScope
+from pyfunq.service_key import ServiceKey
+from tests.test_container import Bar, FooContextManager, IBar, IFoo
+
+
+class TestContainerStats:
+    def test_stats_of_an_empty_container(self):
+        container = Container()
+        stats = container.collect_stats()
+
+        assert stats.services_count == 0
+        assert stats.pending_registrations_count == 0
+        assert stats.cached_instances_count == 0
+        assert stats.live_disposables_count == 0
+        assert stats.dead_disposables_count == 0
+        assert stats.instances_retained_size == 0
+        assert stats.retained_size == stats.bookkeeping_size
+        assert stats.child_containers == []
+
+    def test_stats_count_services_and_pending_registrations(self):
+        container = Container()
+        container.register(IBar, lambda c: Bar())
+        container.configure()
+        container.register(IFoo, lambda c: FooContextManager())
+        stats = container.collect_stats()
+
+        assert stats.services_count == 1
+        assert stats.pending_registrations_count == 1
+
+    def test_stats_report_cached_instances_by_service_key_and_reuse_scope(self):
+        container = Container()
+        container.register(IBar, lambda c: Bar()).reused_within(ReuseScope.Container)
+        container.register(IBar, lambda c: Bar()).named("a").reused_within(ReuseScope.Hierarchy)
+        container.register(IFoo, lambda c: FooContextManager()).reused_within(ReuseScope.NoReuse)
+        container.configure()
+        container.resolve(IBar)
+        container.resolve_named(IBar, "a")
+        container.resolve(IFoo)
+        stats = container.collect_stats()
+        cached_instances = {cached_instance.service_key: cached_instance for cached_instance in stats.cached_instances}
+
+        assert stats.cached_instances_count == 2
+        assert cached_instances[ServiceKey(IBar, tuple())].reuse_scope == ReuseScope.Container
+        assert cached_instances[ServiceKey(IBar, tuple(), "a")].reuse_scope == ReuseScope.Hierarchy
+        assert cached_instances[ServiceKey(IBar, tuple())].instance_type is Bar
+        assert stats.instances_retained_size > 0
+        assert stats.instances_count_by_reuse_scope == {
+            ReuseScope.NoReuse: 0,
+            ReuseScope.Container: 1,
+            ReuseScope.Hierarchy: 1,
+        }
+
+    def test_stats_distinguish_live_and_dead_disposables(self):
+        foo: FooContextManager | None
+
+        with Container() as container:
+            container \
+                .register(IFoo, lambda c: FooContextManager()) \
+                .owned_by(Owner.Container)
+            container.configure()
+            foo = cast(FooContextManager, container.resolve(IFoo))
+            container.resolve(IFoo)
+            gc.collect()
+            stats = container.collect_stats()
+
+            assert foo is not None
+            assert stats.live_disposables_count == 1
+            assert stats.dead_disposables_count == 1
+
+    def test_stats_include_child_containers(self):
+        container = Container()
+        container.register(IBar, lambda c: Bar()).reused_within(ReuseScope.Container)
+        container.configure()
+        child_container = container.create_child_container()
+        container.resolve(IBar)
+        child_container.resolve(IBar)
+        stats = container.collect_stats()
+
+        assert len(stats.child_containers) == 1
+        assert stats.child_containers[0].cached_instances_count == 1
+        assert stats.total_retained_size == stats.retained_size + stats.child_containers[0].retained_size
+
+    def test_stats_report_deep_retained_size_of_cached_instances(self):
+        container = Container()
+        container.register(list, lambda c: [str(i) * 100 for i in range(1000)]).reused_within(ReuseScope.Container)
+        container.configure()
+        instance = container.resolve(list)
+        stats = container.collect_stats()
+        cached_instance = stats.cached_instances[0]
+
+        assert cached_instance.retained_size >= sys.getsizeof(instance) + sum(sys.getsizeof(s) for s in instance)
+        assert not cached_instance.is_truncated
+        assert stats.retained_size == stats.bookkeeping_size + cached_instance.retained_size
+
+    def test_stats_bound_the_walk_of_large_cached_instances(self):
+        container = Container()
+        container.register(list, lambda c: [str(i) for i in range(1000)]).reused_within(ReuseScope.Container)
+        container.configure()
+        container.resolve(list)
+        cached_instance = container.collect_stats(max_objects_per_instance=10).cached_instances[0]
+
+        assert cached_instance.is_truncated
+
+    def test_stats_stop_at_the_container_and_other_cached_instances(self):
+        container = Container()
+        container.register(IFoo, lambda c: ContainerHolder(c)).reused_within(ReuseScope.Container)
+        container.register(IBar, lambda c: BarHolder(c, c.resolve(IFoo))).reused_within(ReuseScope.Container)
+        container.configure()
+        holder = container.resolve(IFoo)
+        container.resolve(IBar)
+        stats = container.collect_stats()
+
+        for cached_instance in stats.cached_instances:
+            assert cached_instance.retained_size < 1000
+            assert not cached_instance.is_truncated
+        assert stats.instances_retained_size < 2 * sys.getsizeof(holder) + 2 * sys.getsizeof(holder.__dict__) + 1000
+
+    def test_stats_bound_the_total_walk_of_a_call(self):
+        container = Container()
+        container.register(list, lambda c: [str(i) for i in range(100)]).reused_within(ReuseScope.Container)
+        container.register(tuple, lambda c: tuple(str(i) for i in range(100))).reused_within(ReuseScope.Container)
+        container.configure()
+        container.resolve(list)
+        container.resolve(tuple)
+        stats = container.collect_stats(max_objects=50)
+
+        assert any(cached_instance.is_truncated for cached_instance in stats.cached_instances)
+
+    def test_stats_do_not_keep_child_containers_alive(self):
+        container = Container()
+        container.create_child_container()
+        gc.collect()
+
+        assert container.collect_stats().child_containers == []
+
+
+class ContainerHolder(IFoo):
+    def __init__(self, container: Container):
+        self._container = container
+
+
+class BarHolder(Bar):
+    def __init__(self, container: Container, foo: IFoo):
+        super().__init__()
+        self._foo = foo
+        self._container = container